@@ -0,0 +1,42 @@
+"""
+Compila la extensión Cython opcional de specterra (``specterra._normalize``).
+
+Si Cython no está disponible o la compilación falla (p. ej. sin compilador
+C u OpenMP), el paquete se instala igualmente en Python puro.
+"""
+
+import sys
+
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+
+if sys.platform == 'win32':
+    compile_args = ['/O2', '/openmp']
+    link_args = []
+else:
+    compile_args = ['-O3', '-fopenmp']
+    link_args = ['-fopenmp']
+
+ext_modules = []
+if cythonize is not None:
+    ext_modules = cythonize(
+        [
+            Extension(
+                'specterra._normalize',
+                ['src/specterra/_normalize.pyx'],
+                extra_compile_args=compile_args,
+                extra_link_args=link_args,
+            )
+        ],
+        language_level=3,
+    )
+    # cythonize no conserva `optional`: un fallo al compilar no debe impedir la instalación
+    for ext in ext_modules:
+        ext.optional = True
+
+setup(ext_modules=ext_modules)
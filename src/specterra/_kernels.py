@@ -0,0 +1,107 @@
+"""
+Kernels numéricos compilados con Numba (dependencia opcional).
+
+Si numba no está instalado, ``HAS_NUMBA`` es False y specterra usa la
+implementación equivalente en NumPy.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+# Bins del histograma de rango fijo (0, 1] con el que se estiman los
+# percentiles del stretch. Es el mismo en los tres backends (NumPy, Numba y la
+# extensión Cython), así que todos devuelven los mismos límites
+HIST_BINS = 16384
+
+# Histogramas parciales que se calculan en paralelo (uno por bloque de filas)
+_HIST_CHUNKS = 8
+
+# fastmath sin 'nnan'/'ninf': los píxeles NaN deben seguir fallando `v > 0`
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+if HAS_NUMBA:
+
+    @njit(parallel=True, fastmath=_FASTMATH, cache=True)
+    def stretch_limits(band, stretch_pct):
+        """
+        Percentiles ``stretch_pct`` y ``100 - stretch_pct`` de los píxeles > 0.
+        
+        Los píxeles se recortan a [0, 1] y se cuantizan en ``HIST_BINS`` bins
+        de rango fijo (0, 1], sin copias de la banda. Devuelve
+        ``(hay_validos, p_low, p_high)``.
+        """
+        h, w = band.shape
+        nbins = HIST_BINS
+        
+        # (a) Histogramas parciales por bloques de filas (sin condiciones de carrera)
+        nchunks = min(h, _HIST_CHUNKS)
+        hist = np.zeros((nchunks, nbins), dtype=np.int64)
+        for c in prange(nchunks):
+            for i in range(c * h // nchunks, (c + 1) * h // nchunks):
+                for j in range(w):
+                    v = band[i, j]
+                    if v > 0.0:
+                        hist[c, min(int(min(v, 1.0) * nbins), nbins - 1)] += 1
+        
+        counts = np.zeros(nbins, dtype=np.int64)
+        for c in range(nchunks):
+            counts += hist[c]
+        
+        total = counts.sum()
+        if total == 0:
+            return False, 0.0, 1.0
+        
+        # (b) Percentiles: primer bin cuyo acumulado alcanza cada objetivo
+        target_low = stretch_pct / 100.0 * total
+        target_high = (100.0 - stretch_pct) / 100.0 * total
+        bin_low = nbins - 1
+        bin_high = nbins - 1
+        found_low = False
+        cum = 0
+        for k in range(nbins):
+            cum += counts[k]
+            if not found_low and cum >= target_low:
+                bin_low = k
+                found_low = True
+            if cum >= target_high:
+                bin_high = k
+                break
+        
+        return True, bin_low / nbins, bin_high / nbins
+
+    @njit(parallel=True, fastmath=_FASTMATH, cache=True)
+    def pack_channel(band, out, p_low, p_high):
+        """
+        Recorta a [p_low, p_high], reescala a 0-255 y escribe en ``out`` (uint8).
+        
+        Los píxeles NaN se tratan como ``p_low`` (igual que la extensión Cython).
+        """
+        h, w = band.shape
+        scale = 255.0 / (p_high - p_low + 1e-10)
+        for i in prange(h):
+            for j in range(w):
+                v = band[i, j]
+                if v != v:
+                    v = p_low
+                else:
+                    v = min(max(v, p_low), p_high)
+                out[i, j] = np.uint8((v - p_low) * scale + 0.5)
+
+    # Se llama desde los hilos que leen bandas en paralelo: nogil=True para que
+    # esos hilos escalen a la vez (como los ufuncs de NumPy), y sin
+    # parallel=True porque la capa de hilos 'workqueue' de Numba no es segura
+    # frente a regiones paralelas lanzadas desde varios hilos
+    @njit(nogil=True, fastmath=_FASTMATH, cache=True)
+    def scale_inplace(data, scale, offset):
+        """Aplica ``data * scale + offset`` in-place en una sola pasada (FMA)."""
+        h, w = data.shape
+        for i in range(h):
+            for j in range(w):
+                data[i, j] = data[i, j] * scale + offset
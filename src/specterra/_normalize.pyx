@@ -0,0 +1,129 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Extensión Cython opcional: stretch por percentiles y empaquetado RGB en uint8.
+
+Se compila desde ``setup.py`` cuando Cython y un compilador están disponibles;
+si no, specterra usa los kernels Numba o la implementación NumPy.
+"""
+
+from cython.parallel cimport prange
+from libc.stdlib cimport calloc, free
+
+
+# Histogramas parciales que se calculan en paralelo (uno por bloque de filas)
+cdef enum:
+    HIST_CHUNKS = 8
+
+
+cdef int _stretch_limits(const float[:, :] band, double stretch, Py_ssize_t nbins,
+                         double* p_low, double* p_high) noexcept nogil:
+    """Percentiles de los píxeles > 0 recortados a [0, 1]; 0 si no hay válidos."""
+    cdef Py_ssize_t c, i, j, k
+    cdef Py_ssize_t h = band.shape[0]
+    cdef Py_ssize_t w = band.shape[1]
+    cdef Py_ssize_t nchunks = h if h < HIST_CHUNKS else HIST_CHUNKS
+    cdef long long total = 0
+    cdef long long cum = 0
+    cdef double v, target_low, target_high
+    cdef Py_ssize_t bin_low = nbins - 1
+    cdef Py_ssize_t bin_high = nbins - 1
+    cdef bint found_low = False
+    cdef long long* hist = <long long*> calloc(nchunks * nbins, sizeof(long long))
+
+    if hist == NULL:
+        return -1
+
+    # Un histograma parcial por bloque de filas (sin condiciones de carrera)
+    for c in prange(nchunks, schedule='static'):
+        for i in range(c * h // nchunks, (c + 1) * h // nchunks):
+            for j in range(w):
+                v = band[i, j]
+                if v > 0.0:
+                    if v > 1.0:
+                        v = 1.0
+                    k = <Py_ssize_t> (v * nbins)
+                    if k >= nbins:
+                        k = nbins - 1
+                    hist[c * nbins + k] += 1
+
+    # Sumar los parciales sobre el primero
+    for c in range(1, nchunks):
+        for k in range(nbins):
+            hist[k] += hist[c * nbins + k]
+    for k in range(nbins):
+        total += hist[k]
+
+    if total == 0:
+        free(hist)
+        return 0
+
+    target_low = stretch / 100.0 * total
+    target_high = (100.0 - stretch) / 100.0 * total
+    for k in range(nbins):
+        cum += hist[k]
+        if not found_low and cum >= target_low:
+            bin_low = k
+            found_low = True
+        if cum >= target_high:
+            bin_high = k
+            break
+
+    free(hist)
+    p_low[0] = <double> bin_low / nbins
+    p_high[0] = <double> bin_high / nbins
+    return 1
+
+
+cdef void _pack_channel(const float[:, :] band, double p_low, double p_high,
+                        unsigned char[:, :, ::1] out, Py_ssize_t channel) noexcept nogil:
+    """Recorta a [p_low, p_high], reescala a 0-255 y escribe el canal en ``out``."""
+    cdef Py_ssize_t i, j
+    cdef double v
+    cdef double scale = 255.0 / (p_high - p_low + 1e-10)
+
+    for i in prange(band.shape[0], schedule='static'):
+        for j in range(band.shape[1]):
+            v = band[i, j]
+            if v != v:
+                v = p_low
+            elif v < p_low:
+                v = p_low
+            elif v > p_high:
+                v = p_high
+            out[i, j, channel] = <unsigned char> ((v - p_low) * scale + 0.5)
+
+
+def stretch_limits(const float[:, :] band, double stretch, Py_ssize_t nbins):
+    """
+    Percentiles ``stretch`` y ``100 - stretch`` de los píxeles > 0 (recortados a
+    [0, 1]) a partir de un histograma de ``nbins`` bins sobre (0, 1]. Devuelve
+    None si no hay píxeles válidos.
+    """
+    if nbins < 1:
+        raise ValueError(f"nbins debe ser positivo: {nbins}")
+
+    cdef double p_low, p_high
+    cdef int found
+
+    with nogil:
+        found = _stretch_limits(band, stretch, nbins, &p_low, &p_high)
+    if found < 0:
+        raise MemoryError("No se pudo reservar el histograma")
+    if found == 0:
+        return None
+    return p_low, p_high
+
+
+def pack_channel(const float[:, :] band, double p_low, double p_high,
+                 unsigned char[:, :, ::1] out, Py_ssize_t channel):
+    """Recorta a [p_low, p_high], reescala a 0-255 y escribe el canal ``channel`` de ``out``."""
+    # Sin boundscheck: comprobar aquí que la banda y el canal caben en ``out``
+    if band.shape[0] != out.shape[0] or band.shape[1] != out.shape[1]:
+        raise ValueError(
+            f"La banda ({band.shape[0]}, {band.shape[1]}) no coincide con la salida "
+            f"({out.shape[0]}, {out.shape[1]})")
+    if not 0 <= channel < out.shape[2]:
+        raise ValueError(f"Canal {channel} fuera de rango para una salida de {out.shape[2]} canales")
+    
+    with nogil:
+        _pack_channel(band, p_low, p_high, out, channel)
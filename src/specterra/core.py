@@ -2,11 +2,22 @@
 Módulo core de specterra - Clase principal para imágenes satelitales
 """
 
+import fnmatch
+import os
+import re
 import numpy as np
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Optional, Union
 import warnings
 
+from . import _kernels
+
+try:
+    from . import _normalize as _ext
+except ImportError:  # extensión Cython no compilada
+    _ext = None
+
 
 # ========== CONFIGURACIÓN DE BANDAS POR SENSOR ==========
 
@@ -62,6 +73,303 @@ SENSOR_CONFIG = {
 }
 
 
+def _compile_patterns(config: dict) -> Dict[str, "re.Pattern"]:
+    """
+    Compila los patrones de archivo (wildcards) de un sensor a expresiones regulares.
+    
+    Como ``fnmatch.filter``, el patrón pasa por ``os.path.normcase`` (en Windows
+    la comparación no distingue mayúsculas); los nombres deben normalizarse igual.
+    """
+    return {band: re.compile(fnmatch.translate(os.path.normcase(pattern)))
+            for band, pattern in config['file_pattern'].items()}
+
+
+# Patrones de cada sensor compilados una sola vez, al importar el módulo
+_FILE_REGEX = {sensor: _compile_patterns(config) for sensor, config in SENSOR_CONFIG.items()}
+
+
+# Número máximo de bandas materializadas que se mantienen en memoria (modo lazy)
+_BAND_CACHE_SIZE = 3
+
+# Máximo de bandas que se leen en paralelo
+_MAX_READ_WORKERS = 8
+
+
+def _read_band(path: Union[str, Path], scale: float, offset: float,
+               out: Optional[np.ndarray] = None, step: int = 1) -> np.ndarray:
+    """
+    Lee una banda como float32 y aplica escala y offset in-place.
+    
+    Si se pasa ``out`` (float32 con el tamaño del raster), la banda se
+    decodifica directamente en ese buffer. Con ``step > 1`` se lee reducida a
+    ``ceil(alto / step) x ceil(ancho / step)``; GDAL usa las overviews del
+    archivo si existen.
+    """
+    import rasterio
+    
+    with rasterio.open(path) as src:
+        if out is not None:
+            data = src.read(1, out=out)
+        elif step > 1:
+            shape = (-(-src.height // step), -(-src.width // step))
+            data = src.read(1, out_shape=shape, out_dtype='float32')
+        else:
+            data = src.read(1, out_dtype='float32')
+    
+    return _scale_inplace(data, scale, offset)
+
+
+def _read_window(path: Union[str, Path], scale: float, offset: float, window) -> np.ndarray:
+    """
+    Lee solo una ventana (``rasterio.windows.Window``) de una banda, como float32.
+    
+    GDAL decodifica únicamente los bloques (tiras o teselas) que cubre la ventana.
+    """
+    import rasterio
+    
+    with rasterio.open(path) as src:
+        data = src.read(1, window=window, out_dtype='float32')
+    
+    return _scale_inplace(data, scale, offset)
+
+
+def _scale_inplace(data: np.ndarray, scale: float, offset: float) -> np.ndarray:
+    """Aplica escala y offset sobre el mismo buffer float32 y lo devuelve."""
+    # Escalares float32 para que el cálculo no promueva a float64
+    scale = np.float32(scale)
+    offset = np.float32(offset)
+    
+    if _kernels.HAS_NUMBA and data.ndim == 2:
+        # Una sola pasada sobre la memoria (multiplicación y suma fusionadas)
+        _kernels.scale_inplace(data, scale, offset)
+        return data
+    
+    # Sin temporales del tamaño del raster
+    np.multiply(data, scale, out=data)
+    np.add(data, offset, out=data)
+    return data
+
+
+def _read_bands(paths: Dict[str, str], scale: float, offset: float,
+                out: Optional[Dict[str, np.ndarray]] = None,
+                steps: Optional[Dict[str, int]] = None) -> Dict[str, np.ndarray]:
+    """
+    Lee varias bandas en paralelo con ``_read_band``.
+    
+    GDAL libera el GIL mientras decodifica, así que los hilos leen y
+    descomprimen los archivos de forma concurrente. ``out`` y ``steps``
+    asignan opcionalmente un buffer de destino o un paso de decimación a
+    cada banda.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    def read(name):
+        return _read_band(paths[name], scale, offset,
+                          out=None if out is None else out[name],
+                          step=1 if steps is None else steps[name])
+    
+    if len(paths) <= 1:
+        return {name: read(name) for name in paths}
+    
+    with ThreadPoolExecutor(max_workers=min(_MAX_READ_WORKERS, len(paths))) as executor:
+        return dict(zip(paths.keys(), executor.map(read, paths.keys())))
+
+
+def _display_step(shape: tuple, max_shape: tuple) -> int:
+    """
+    Paso de decimación entero para visualizar un raster de tamaño ``shape``.
+    
+    El resultado conserva al menos ~2x los píxeles de pantalla ``max_shape``
+    (alto, ancho) en cada eje; más resolución no se ve y solo encarece imshow.
+    """
+    return max(1, int(min(shape[0] / (2 * max_shape[0]), shape[1] / (2 * max_shape[1]))))
+
+
+def _fit_display(rgb: np.ndarray, max_shape: tuple) -> np.ndarray:
+    """
+    Reduce un RGB uint8 (H, W, 3) para que quepa en ``max_shape`` (alto, ancho)
+    conservando la proporción. Nunca amplía.
+    
+    Así imshow recibe una imagen a resolución de pantalla y no remuestrea en
+    cada redibujado.
+    """
+    from PIL import Image
+    
+    factor = min(max_shape[0] / rgb.shape[0], max_shape[1] / rgb.shape[1])
+    if factor >= 1:
+        return rgb
+    
+    size = (max(1, round(rgb.shape[1] * factor)), max(1, round(rgb.shape[0] * factor)))
+    return np.asarray(Image.fromarray(rgb).resize(size, Image.BILINEAR))
+
+
+# Bins del histograma con el que se estiman los percentiles (común a los tres
+# backends). El rango es fijo, (0, 1]: cada bin mide ~6e-5 de reflectancia
+_HIST_BINS = _kernels.HIST_BINS
+
+# Tamaño de bloque (~1 MB) para que cada bloque quepa en la caché L2
+_BLOCK_BYTES = 1 << 20
+
+
+def _block_rows(row_nbytes: int) -> int:
+    """Número de filas que caben en un bloque de ``_BLOCK_BYTES`` bytes."""
+    return max(1, _BLOCK_BYTES // max(row_nbytes, 1))
+
+
+def _row_blocks(height: int, row_nbytes: int):
+    """Genera rebanadas de filas de aproximadamente ``_BLOCK_BYTES`` bytes."""
+    rows = _block_rows(row_nbytes)
+    for start in range(0, height, rows):
+        yield slice(start, start + rows)
+
+
+# Píxeles por banda a partir de los cuales los percentiles se estiman sobre
+# una submuestra regular (para visualizar basta con ~0.1% de precisión)
+_STRETCH_SAMPLE = 1_000_000
+
+
+def _stretch_sample(band: np.ndarray) -> np.ndarray:
+    """Vista con paso ``s`` en ambos ejes para quedarse en ~``_STRETCH_SAMPLE`` píxeles (sin copia)."""
+    if band.size <= _STRETCH_SAMPLE:
+        return band
+    step = int(np.ceil(np.sqrt(band.size / _STRETCH_SAMPLE)))
+    return band[::step, ::step]
+
+
+def _stretch_limits(bands, stretch_pct: float) -> list:
+    """
+    Percentiles ``stretch_pct`` y ``100 - stretch_pct`` de los píxeles válidos
+    de cada banda: una lista con ``(p_low, p_high)``, o None si la banda no
+    tiene píxeles válidos.
+    
+    Las bandas se recortan a [0, 1] y se cuantizan en un histograma de rango
+    fijo (0, 1] con ``_HIST_BINS`` bins por canal, igual en la extensión
+    Cython, el kernel Numba y NumPy, así que el backend no cambia el
+    resultado. El error es como mucho el ancho de un bin. En NumPy los píxeles
+    <= 0 van a un bin descartado, así que no hace falta compactar los válidos
+    en una copia; las bandas se recorren juntas por bloques de filas y los
+    histogramas de todos los canales salen de un único ``np.bincount`` por
+    bloque.
+    
+    Las bandas de más de ``_STRETCH_SAMPLE`` píxeles se submuestrean con un
+    paso regular antes de construir el histograma.
+    """
+    if not bands:
+        return []
+    
+    bands = [_stretch_sample(band) for band in bands]
+    
+    if _ext is not None:
+        return [_ext.stretch_limits(np.asarray(band, dtype=np.float32), float(stretch_pct),
+                                _HIST_BINS)
+                for band in bands]
+    
+    if _kernels.HAS_NUMBA:
+        limits = []
+        for band in bands:
+            found, p_low, p_high = _kernels.stretch_limits(band, float(stretch_pct))
+            limits.append((p_low, p_high) if found else None)
+        return limits
+    
+    if len({band.shape for band in bands}) > 1:
+        # Resoluciones distintas: no se pueden recorrer juntas
+        return [_stretch_limits([band], stretch_pct)[0] for band in bands]
+    
+    n_bands = len(bands)
+    height, width = bands[0].shape
+    discard = n_bands * _HIST_BINS
+    channel_offset = (np.arange(n_bands) * _HIST_BINS)[:, None, None]
+    hist = np.zeros(discard + 1, dtype=np.int64)
+    
+    # Buffers de un bloque (todas las bandas) reutilizados en cada iteración
+    block_shape = (n_bands, _block_rows(width * 4 * n_bands), width)
+    block_buf = np.empty(block_shape, dtype=np.float32)
+    bins_buf = np.empty(block_shape, dtype=np.intp)
+    invalid_buf = np.empty(block_shape, dtype=bool)
+    
+    for rows in _row_blocks(height, width * 4 * n_bands):
+        n_rows = min(rows.stop, height) - rows.start
+        block = block_buf[:, :n_rows]
+        bins = bins_buf[:, :n_rows]
+        invalid = invalid_buf[:, :n_rows]
+        for i, band in enumerate(bands):
+            block[i] = band[rows]
+        
+        np.greater(block, 0, out=invalid)
+        np.logical_not(invalid, out=invalid)
+        np.minimum(block, 1, out=block)
+        np.copyto(block, 0, where=invalid)
+        np.multiply(block, _HIST_BINS, out=block)
+        np.copyto(bins, block, casting='unsafe')
+        np.minimum(bins, _HIST_BINS - 1, out=bins)
+        bins += channel_offset
+        np.copyto(bins, discard, where=invalid)
+        hist += np.bincount(bins.ravel(), minlength=discard + 1)
+    
+    cdf = np.cumsum(hist[:discard].reshape(n_bands, _HIST_BINS), axis=1)
+    edges = np.arange(_HIST_BINS + 1) / _HIST_BINS
+    limits = []
+    for channel_cdf in cdf:
+        if channel_cdf[-1] == 0:
+            limits.append(None)
+            continue
+        targets = np.array([stretch_pct, 100 - stretch_pct]) / 100 * channel_cdf[-1]
+        i_low, i_high = np.searchsorted(channel_cdf, targets)
+        limits.append((float(edges[i_low]), float(edges[i_high])))
+    return limits
+
+
+def _pack_rgb(bands, limits) -> np.ndarray:
+    """
+    Composición (H, W, 3) uint8 con un stretch lineal por canal.
+    
+    ``limits`` contiene un ``(p_low, p_high)`` por banda. Los límites se
+    calculan en float32, pero el resultado se emite en 8 bits: es lo que llega
+    a la pantalla y ocupa 4 veces menos que float32.
+    
+    Todas las bandas deben tener el mismo tamaño (los kernels compilados no
+    comprueban límites), si no se lanza ValueError.
+    """
+    shapes = [band.shape for band in bands]
+    if len(set(shapes)) > 1:
+        raise ValueError(f"Las bandas RGB deben tener el mismo tamaño; recibidas: {shapes}")
+    
+    height, width = bands[0].shape
+    out = np.empty((height, width, len(bands)), dtype=np.uint8)
+    
+    if _ext is not None:
+        for i, (band, (p_low, p_high)) in enumerate(zip(bands, limits)):
+            _ext.pack_channel(np.asarray(band, dtype=np.float32), p_low, p_high, out, i)
+        return out
+    
+    if _kernels.HAS_NUMBA:
+        for i, (band, (p_low, p_high)) in enumerate(zip(bands, limits)):
+            _kernels.pack_channel(band, out[..., i], p_low, p_high)
+        return out
+    
+    p_low = np.array([lim[0] for lim in limits], dtype=np.float32)
+    p_high = np.array([lim[1] for lim in limits], dtype=np.float32)
+    scale = 255 / (p_high - p_low + 1e-10)
+    
+    # Recorte, reescalado a 0-255 y escritura en uint8 por bloques de filas,
+    # sobre un único buffer float32 del tamaño de un bloque reutilizado en los
+    # tres canales. Como 0 <= p_low <= p_high <= 1, recortar a [p_low, p_high]
+    # equivale a recortar a [0, 1] antes y después del reescalado
+    scratch = np.empty((_block_rows(width * 4), width), dtype=np.float32)
+    for rows in _row_blocks(height, width * 4):
+        for i, band in enumerate(bands):
+            block = band[rows]
+            tmp = scratch[:block.shape[0]]
+            np.clip(block, p_low[i], p_high[i], out=tmp)
+            tmp -= p_low[i]
+            # NaN -> p_low, como en los kernels compilados
+            np.nan_to_num(tmp, copy=False, nan=0.0)
+            tmp *= scale[i]
+            np.rint(tmp, out=tmp)
+            out[rows, :, i] = tmp
+    return out
+
+
 # ========== CLASE PRINCIPAL ==========
 
 class SatelliteImage:
@@ -79,12 +387,14 @@ class SatelliteImage:
     sensor : str
         Tipo de sensor
     bands : dict
-        Diccionario con bandas cargadas (nombres abstractos: 'red', 'nir', etc.)
+        Diccionario con bandas encontradas (nombres abstractos: 'red', 'nir', etc.).
+        Contiene la ruta del archivo, o el array si ``keep_in_memory=True``
     metadata : dict
         Metadatos geoespaciales
     """
     
-    def __init__(self, path: Union[str, Path], sensor: str = 'landsat9c2'):
+    def __init__(self, path: Union[str, Path], sensor: str = 'landsat9c2',
+                 keep_in_memory: bool = False):
         """
         Inicializa la imagen satelital.
         
@@ -94,11 +404,19 @@ class SatelliteImage:
             Ruta al directorio que contiene las bandas
         sensor : str
             Tipo de sensor: 'landsat9c2', 'landsat8c2', 'sentinel2'
+        keep_in_memory : bool
+            Si es True, lee todas las bandas al cargar. Por defecto las bandas
+            se leen bajo demanda en ``get_band`` (default=False)
         """
         self.path = Path(path)
         self.sensor = sensor
+        self.keep_in_memory = keep_in_memory
         self.bands = {}
         self.metadata = None
+        self._cache = OrderedDict()
+        self._cube = None
+        self._band_index = {}
+        self._pctile_cache: Dict[tuple, tuple] = {}
         
         if sensor not in SENSOR_CONFIG:
             raise ValueError(f"Sensor '{sensor}' no soportado. Opciones: {list(SENSOR_CONFIG.keys())}")
@@ -107,34 +425,36 @@ class SatelliteImage:
         self._load_bands()
     
     def _load_bands(self):
-        """Carga las bandas desde archivos usando rasterio."""
+        """Localiza las bandas y las carga con rasterio (o las deja para lectura bajo demanda)."""
         import rasterio
-        import glob
-        import os
         
         file_patterns = self.config['file_pattern']
+        file_regex = _FILE_REGEX.get(self.sensor) or _compile_patterns(self.config)
         scale = self.config['scale_factor']
         offset = self.config['offset']
         
         print(f"🛰️  Cargando {self.config['name']}...")
         
+        # Listar el directorio una sola vez y buscar los patrones en memoria
+        # (como glob, se ignoran los archivos ocultos)
+        with os.scandir(self.path) as it:
+            entries = [entry.name for entry in it
+                       if entry.is_file() and not entry.name.startswith('.')]
+        
         for band_name, pattern in file_patterns.items():
             # Buscar archivo de banda
-            files = glob.glob(os.path.join(str(self.path), pattern))
+            files = [name for name in entries
+                     if file_regex[band_name].match(os.path.normcase(name))]
             
             if not files:
                 warnings.warn(f"⚠️  No se encontró banda '{band_name}' con patrón {pattern}")
                 continue
             
-            # Leer la banda
-            with rasterio.open(files[0]) as src:
-                data = src.read(1).astype(np.float32)
-                
-                # Aplicar escala y offset
-                self.bands[band_name] = data * scale + offset
-                
-                # Guardar metadatos de la primera banda
-                if self.metadata is None:
+            self.bands[band_name] = os.path.join(str(self.path), files[0])
+            
+            # Guardar metadatos de la primera banda (solo lee la cabecera)
+            if self.metadata is None:
+                with rasterio.open(self.bands[band_name]) as src:
                     self.metadata = {
                         'crs': src.crs,
                         'transform': src.transform,
@@ -144,9 +464,40 @@ class SatelliteImage:
                         'sensor': self.config['name']
                     }
         
-        print(f"✓ Cargadas {len(self.bands)} bandas: {list(self.bands.keys())}")
+        # Leer todas las bandas ahora, o dejar las rutas para leerlas bajo demanda
+        if self.keep_in_memory:
+            self._load_cube(scale, offset)
+            print(f"✓ Cargadas {len(self.bands)} bandas: {list(self.bands.keys())}")
+        else:
+            print(f"✓ Encontradas {len(self.bands)} bandas (lectura bajo demanda): {list(self.bands.keys())}")
+    
+    def _load_cube(self, scale: float, offset: float):
+        """
+        Lee todas las bandas en un único array contiguo (C, H, W).
+        
+        ``self.bands`` queda con vistas sobre el cubo. Si las bandas tienen
+        resoluciones distintas (p. ej. Sentinel-2) se lee un array por banda.
+        """
+        import rasterio
+        
+        shapes = set()
+        for path in self.bands.values():
+            with rasterio.open(path) as src:
+                shapes.add(src.shape)
+        
+        if len(shapes) != 1:
+            self.bands.update(_read_bands(self.bands, scale, offset))
+            return
+        
+        height, width = shapes.pop()
+        self._cube = np.empty((len(self.bands), height, width), dtype=np.float32)
+        self._band_index = {name: i for i, name in enumerate(self.bands)}
+        views = {name: self._cube[i] for name, i in self._band_index.items()}
+        
+        _read_bands(self.bands, scale, offset, out=views)
+        self.bands.update(views)
     
-    def get_band(self, name: str) -> np.ndarray:
+    def get_band(self, name: str, window=None) -> np.ndarray:
         """
         Obtiene una banda por su nombre abstracto.
         
@@ -154,16 +505,110 @@ class SatelliteImage:
         -----------
         name : str
             Nombre de la banda ('red', 'nir', 'swir1', etc.)
+        window : rasterio.windows.Window, optional
+            Ventana a leer. Si la banda no está en memoria se lee solo esa
+            ventana, sin cargar ni cachear la banda completa; permite procesar
+            escenas más grandes que la RAM por bloques
         
         Returns:
         --------
         np.ndarray
-            Array con los valores de la banda
+            Array con los valores de la banda (reflectancia, float32)
         """
         if name not in self.bands:
             available = list(self.bands.keys())
             raise KeyError(f"Banda '{name}' no disponible. Bandas cargadas: {available}")
-        return self.bands[name]
+        
+        if name in self._band_index:
+            band = self._cube[self._band_index[name]]
+        else:
+            band = self.bands[name]
+        
+        # Modo lazy: mantener las últimas bandas usadas (LRU)
+        if not isinstance(band, np.ndarray) and name in self._cache:
+            self._cache.move_to_end(name)
+            band = self._cache[name]
+        
+        if isinstance(band, np.ndarray):
+            return band if window is None else band[window.toslices()]
+        
+        if window is not None:
+            return _read_window(band, self.config['scale_factor'], self.config['offset'], window)
+        
+        data = _read_band(band, self.config['scale_factor'], self.config['offset'])
+        self._cache_band(name, data)
+        return data
+    
+    def _get_bands(self, names, max_shape: Optional[tuple] = None) -> list:
+        """
+        Obtiene varias bandas, leyendo en paralelo las que no están en memoria.
+        
+        Con ``max_shape`` (alto, ancho en píxeles de pantalla) cada banda se
+        submuestrea con el paso de ``_display_step``: las que están en memoria
+        con una vista y las que están en disco leyéndolas ya reducidas, sin
+        pasar por la caché.
+        """
+        steps = {
+            name: 1 if max_shape is None else _display_step(self._band_shape(name), max_shape)
+            for name in names
+        }
+        pending = {
+            name: self.bands[name] for name in names
+            if not isinstance(self.bands[name], np.ndarray) and name not in self._cache
+        }
+        loaded = _read_bands(pending, self.config['scale_factor'], self.config['offset'],
+                             steps=steps)
+        
+        bands = []
+        for name in names:
+            if name in loaded:
+                bands.append(loaded[name])
+            else:
+                step = steps[name]
+                bands.append(self.get_band(name)[::step, ::step])
+        
+        for name, data in loaded.items():
+            if steps[name] == 1:
+                self._cache_band(name, data)
+        return bands
+    
+    def _band_shape(self, name: str) -> tuple:
+        """Tamaño (alto, ancho) de una banda, sin leerla si está en disco."""
+        import rasterio
+        
+        band = self.bands[name]
+        if isinstance(band, np.ndarray):
+            return band.shape
+        if name in self._cache:
+            return self._cache[name].shape
+        with rasterio.open(band) as src:
+            return src.shape
+    
+    def _cache_band(self, name: str, data: np.ndarray):
+        """Guarda una banda leída en la caché LRU, descartando la menos reciente."""
+        self._cache[name] = data
+        self._cache.move_to_end(name)
+        if len(self._cache) > _BAND_CACHE_SIZE:
+            self._cache.popitem(last=False)
+    
+    def _get_stretch(self, names, stretch: float, bands) -> list:
+        """
+        Límites ``(p_low, p_high)`` del stretch de varias bandas, memorizados.
+        
+        Se calculan sobre ``bands`` la primera vez que se piden para cada
+        ``(nombre, stretch)``, todas las que falten a la vez; las llamadas
+        siguientes a ``plot_rgb`` con esas bandas los reutilizan. Sin píxeles
+        válidos la banda solo se recorta.
+        """
+        missing = {}
+        for name, band in zip(names, bands):
+            if (name, float(stretch)) not in self._pctile_cache:
+                missing[name] = band
+        
+        if missing:
+            for name, limits in zip(missing, _stretch_limits(list(missing.values()), stretch)):
+                self._pctile_cache[(name, float(stretch))] = limits if limits is not None else (0.0, 1.0)
+        return [self._pctile_cache[(name, float(stretch))] for name in names]
     
     def plot_rgb(self, r='red', g='green', b='blue', stretch=2, figsize=(12, 10)):
         """
@@ -185,31 +630,25 @@ class SatelliteImage:
             if band_name not in self.bands:
                 raise ValueError(f"Banda '{band_name}' no disponible. Opciones: {list(self.bands.keys())}")
         
-        # Obtener bandas
-        red_band = self.get_band(r)
-        green_band = self.get_band(g)
-        blue_band = self.get_band(b)
-        
-        # Normalizar
-        def normalize(band, stretch_pct=2):
-            band_clip = np.clip(band, 0, 1)
-            valid = band_clip[band_clip > 0]
-            if len(valid) == 0:
-                return band_clip
-            p_low = np.percentile(valid, stretch_pct)
-            p_high = np.percentile(valid, 100 - stretch_pct)
-            return np.clip((band_clip - p_low) / (p_high - p_low + 1e-10), 0, 1)
-        
-        # Crear RGB
-        rgb = np.dstack([
-            normalize(red_band, stretch),
-            normalize(green_band, stretch),
-            normalize(blue_band, stretch)
-        ])
-        
-        # Plotear
+        # Comparar la resolución nativa: tras decimar para pantalla, bandas de
+        # distinto tamaño podrían coincidir o no según figsize
+        shapes = [self._band_shape(band_name) for band_name in [r, g, b]]
+        if len(set(shapes)) > 1:
+            raise ValueError(f"Las bandas RGB deben tener el mismo tamaño; recibidas: {shapes}")
+        
+        # Obtener bandas a resolución de pantalla (las que no estén en memoria
+        # se leen en paralelo y ya reducidas)
+        dpi = plt.rcParams['figure.dpi']
+        max_shape = (figsize[1] * dpi, figsize[0] * dpi)
+        red_band, green_band, blue_band = self._get_bands([r, g, b], max_shape=max_shape)
+        
+        # Crear RGB normalizado (percentiles memorizados por banda y stretch)
+        bands = (red_band, green_band, blue_band)
+        rgb = _pack_rgb(bands, self._get_stretch((r, g, b), stretch, bands))
+        
+        # Plotear a resolución de pantalla; 'nearest' evita el remuestreo interno
         fig, ax = plt.subplots(figsize=figsize)
-        ax.imshow(rgb)
+        ax.imshow(_fit_display(rgb, max_shape), interpolation='nearest')
         ax.set_title(f"RGB ({r.upper()}, {g.upper()}, {b.upper()}) - {self.config['name']}", 
                     fontsize=14, fontweight='bold')
         ax.axis('off')
@@ -224,7 +663,8 @@ class SatelliteImage:
 
 # ========== FUNCIÓN DE CARGA ==========
 
-def load(path: Union[str, Path], sensor: str = 'landsat9c2') -> SatelliteImage:
+def load(path: Union[str, Path], sensor: str = 'landsat9c2',
+         keep_in_memory: bool = False) -> SatelliteImage:
     """
     Carga una imagen satelital.
     
@@ -234,6 +674,8 @@ def load(path: Union[str, Path], sensor: str = 'landsat9c2') -> SatelliteImage:
         Ruta al directorio con las bandas
     sensor : str
         Tipo de sensor: 'landsat9c2', 'landsat8c2', 'sentinel2'
+    keep_in_memory : bool
+        Si es True, lee todas las bandas al cargar (default=False)
     
     Returns:
     --------
@@ -246,8 +688,7 @@ def load(path: Union[str, Path], sensor: str = 'landsat9c2') -> SatelliteImage:
     >>> img = specterra.load("path/to/landsat/", sensor='landsat9c2')
     >>> img.plot_rgb()
     """
-    import os
     if not os.path.exists(path):
         raise FileNotFoundError(f"No existe la ruta: {path}")
     
-    return SatelliteImage(path, sensor=sensor)
+    return SatelliteImage(path, sensor=sensor, keep_in_memory=keep_in_memory)
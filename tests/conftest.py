@@ -0,0 +1,91 @@
+"""
+Fixtures comunes: escenas Landsat sintéticas y selección del backend de stretch.
+"""
+
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy as np
+import pytest
+
+from specterra import core, _kernels
+
+
+# Tamaño de las escenas sintéticas (alto, ancho)
+SCENE_SHAPE = (120, 160)
+
+# Bandas Landsat C2 que se escriben: nombre abstracto -> sufijo del archivo
+LANDSAT_BANDS = {
+    'coastal': 'SR_B1',
+    'blue': 'SR_B2',
+    'green': 'SR_B3',
+    'red': 'SR_B4',
+    'nir': 'SR_B5',
+    'swir1': 'SR_B6',
+    'swir2': 'SR_B7',
+}
+
+
+def write_band(path, data):
+    """Escribe un GeoTIFF uint16 de una banda con teselas de 64x64."""
+    import rasterio
+    from rasterio.transform import from_origin
+
+    profile = {
+        'driver': 'GTiff',
+        'dtype': 'uint16',
+        'count': 1,
+        'height': data.shape[0],
+        'width': data.shape[1],
+        'crs': 'EPSG:32719',
+        'transform': from_origin(300000, 7000000, 30, 30),
+        'tiled': True,
+        'blockxsize': 64,
+        'blockysize': 64,
+        'compress': 'deflate',
+    }
+    with rasterio.open(path, 'w', **profile) as dst:
+        dst.write(data, 1)
+
+
+def write_scene(directory, shapes=None, seed=0):
+    """
+    Escribe una escena Landsat 9 C2 sintética en ``directory``.
+
+    ``shapes`` permite dar a algunas bandas un tamaño distinto de ``SCENE_SHAPE``.
+    Las primeras filas valen 0 (sin dato), como el borde de una escena real.
+    """
+    rng = np.random.default_rng(seed)
+    config = core.SENSOR_CONFIG['landsat9c2']
+    shapes = shapes or {}
+
+    for name, suffix in LANDSAT_BANDS.items():
+        shape = shapes.get(name, SCENE_SHAPE)
+        reflectance = rng.uniform(-0.05, 1.05, size=shape)
+        data = np.round((reflectance - config['offset']) / config['scale_factor'])
+        data = data.clip(1, 65535).astype(np.uint16)
+        data[:5] = 0
+        write_band(directory / f"LC09_L2SP_001002_20240101_20240102_02_T1_{suffix}.TIF", data)
+    return directory
+
+
+@pytest.fixture
+def scene(tmp_path):
+    """Directorio con una escena sintética de bandas del mismo tamaño."""
+    return write_scene(tmp_path)
+
+
+@pytest.fixture(params=['numpy', 'numba', 'cython'])
+def backend(request, monkeypatch):
+    """Fuerza uno de los backends de stretch; se salta si no está disponible."""
+    name = request.param
+    if name == 'cython' and core._ext is None:
+        pytest.skip("extensión Cython no compilada")
+    if name == 'numba' and not _kernels.HAS_NUMBA:
+        pytest.skip("numba no instalado")
+
+    if name != 'cython':
+        monkeypatch.setattr(core, '_ext', None)
+    if name == 'numpy':
+        monkeypatch.setattr(_kernels, 'HAS_NUMBA', False)
+    return name
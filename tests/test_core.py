@@ -0,0 +1,113 @@
+"""
+Tests de SatelliteImage sobre escenas Landsat sintéticas.
+"""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import specterra
+from conftest import LANDSAT_BANDS, SCENE_SHAPE, write_scene
+
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    yield
+    plt.close('all')
+
+
+@pytest.mark.parametrize('keep_in_memory', [False, True])
+def test_load_finds_bands(scene, keep_in_memory):
+    img = specterra.load(scene, keep_in_memory=keep_in_memory)
+
+    assert set(img.bands) == set(LANDSAT_BANDS)
+    assert (img.metadata['height'], img.metadata['width']) == SCENE_SHAPE
+    assert img.get_band('red').shape == SCENE_SHAPE
+
+
+def test_plot_rgb_repeated(scene, backend):
+    img = specterra.load(scene)
+
+    first = img.plot_rgb()
+    second = img.plot_rgb()
+
+    rgb_first = first.axes[0].get_images()[0].get_array()
+    rgb_second = second.axes[0].get_images()[0].get_array()
+    assert rgb_first.dtype == np.uint8
+    np.testing.assert_array_equal(rgb_first, rgb_second)
+
+
+def test_plot_rgb_reuses_cached_percentiles(scene, backend, monkeypatch):
+    from specterra import core
+
+    calls = []
+    stretch_limits = core._stretch_limits
+
+    def counting_stretch_limits(bands, stretch_pct):
+        calls.append([band.copy() for band in bands])
+        return stretch_limits(bands, stretch_pct)
+
+    monkeypatch.setattr(core, '_stretch_limits', counting_stretch_limits)
+    img = specterra.load(scene)
+
+    img.plot_rgb()
+    assert len(calls) == 1 and len(calls[0]) == 3
+
+    # Mismas bandas y stretch: no se vuelve a calcular nada
+    img.plot_rgb()
+    assert len(calls) == 1
+
+    # Solo falta 'nir' (red y green ya están memorizadas)
+    img.plot_rgb('nir', 'red', 'green')
+    assert len(calls) == 2 and len(calls[1]) == 1
+    np.testing.assert_array_equal(calls[1][0], img.get_band('nir'))
+
+    # Otro stretch es otra entrada de la caché
+    img.plot_rgb(stretch=5)
+    assert len(calls) == 3 and len(calls[2]) == 3
+
+
+def test_plot_rgb_downscales_to_figure(scene, backend):
+    img = specterra.load(scene)
+    dpi = plt.rcParams['figure.dpi']
+
+    fig = img.plot_rgb(figsize=(80 / dpi, 60 / dpi))
+
+    height, width = fig.axes[0].get_images()[0].get_array().shape[:2]
+    assert height <= 60 and width <= 80
+
+
+@pytest.mark.parametrize('keep_in_memory', [False, True])
+@pytest.mark.parametrize('figsize', [(12, 10), (10, 8), (0.4, 0.3)])
+def test_plot_rgb_mismatched_shapes(tmp_path, backend, keep_in_memory, figsize):
+    # Con figsize=(0.4, 0.3) la banda grande se decima a paso 2 y las tres
+    # quedarían del mismo tamaño: el error no debe depender de figsize
+    write_scene(tmp_path, shapes={'red': (SCENE_SHAPE[0] // 2, SCENE_SHAPE[1] // 2)})
+    img = specterra.load(tmp_path, keep_in_memory=keep_in_memory)
+
+    with pytest.raises(ValueError):
+        img.plot_rgb('red', 'green', 'blue', figsize=figsize)
+
+
+@pytest.mark.parametrize('keep_in_memory', [False, True])
+def test_get_band_window_matches_rasterio(scene, keep_in_memory):
+    import rasterio
+    from rasterio.windows import Window
+
+    img = specterra.load(scene, keep_in_memory=keep_in_memory)
+    window = Window(col_off=10, row_off=20, width=70, height=45)
+
+    with rasterio.open(next(scene.glob('*_SR_B5.TIF'))) as src:
+        expected = src.read(1, window=window).astype(np.float64)
+    expected = expected * img.config['scale_factor'] + img.config['offset']
+
+    band = img.get_band('nir', window=window)
+    assert band.dtype == np.float32
+    np.testing.assert_allclose(band, expected, atol=1e-6)
+
+
+def test_get_band_unknown(scene):
+    img = specterra.load(scene)
+
+    with pytest.raises(KeyError):
+        img.get_band('thermal')
@@ -0,0 +1,82 @@
+"""
+Tests del stretch por percentiles y del empaquetado RGB en sus tres backends.
+"""
+
+import numpy as np
+import pytest
+
+from specterra import core, _kernels
+
+
+def _random_bands(shape=(300, 400), n=3, seed=1):
+    rng = np.random.default_rng(seed)
+    bands = [rng.uniform(-0.1, 1.1, size=shape).astype(np.float32) for _ in range(n)]
+    bands[0][::7, ::5] = np.nan
+    return bands
+
+
+@pytest.mark.parametrize('stretch', [0, 2, 10])
+def test_backends_agree(backend, monkeypatch, stretch):
+    # Mismo histograma de rango fijo en los tres backends: límites idénticos
+    bands = _random_bands()
+    limits = core._stretch_limits(bands, stretch)
+
+    monkeypatch.setattr(core, '_ext', None)
+    monkeypatch.setattr(_kernels, 'HAS_NUMBA', False)
+    reference = core._stretch_limits(bands, stretch)
+
+    assert limits == reference
+
+
+def test_stretch_limits_close_to_percentile():
+    band = _random_bands(n=1)[0]
+    valid = np.clip(band[band > 0], 0, 1)
+    expected = np.percentile(valid, [2, 98])
+
+    p_low, p_high = core._stretch_limits([band], 2)[0]
+    assert p_low == pytest.approx(expected[0], abs=1 / core._HIST_BINS)
+    assert p_high == pytest.approx(expected[1], abs=1 / core._HIST_BINS)
+
+
+def test_stretch_limits_without_valid_pixels(backend):
+    bands = [np.zeros((50, 60), dtype=np.float32), _random_bands((50, 60), n=1)[0]]
+    limits = core._stretch_limits(bands, 2)
+
+    assert limits[0] is None
+    assert limits[1] is not None
+
+
+def test_stretch_limits_empty(backend):
+    assert core._stretch_limits([], 2) == []
+
+
+def test_pack_rgb_backends_agree(backend):
+    bands = _random_bands((64, 80))
+    limits = [(0.05, 0.9), (0.1, 0.8), (0.0, 1.0)]
+    rgb = core._pack_rgb(bands, limits)
+
+    assert rgb.dtype == np.uint8 and rgb.shape == (64, 80, 3)
+
+    # Referencia: stretch lineal en float64, NaN -> 0
+    for i, (band, (p_low, p_high)) in enumerate(zip(bands, limits)):
+        expected = (np.clip(band, p_low, p_high) - p_low) * 255 / (p_high - p_low)
+        expected = np.nan_to_num(expected, nan=0.0)
+        assert np.abs(rgb[..., i].astype(float) - expected).max() <= 1
+
+
+def test_pack_rgb_mismatched_shapes(backend):
+    bands = [np.zeros((40, 50), np.float32), np.zeros((20, 25), np.float32),
+             np.zeros((40, 50), np.float32)]
+
+    with pytest.raises(ValueError):
+        core._pack_rgb(bands, [(0.0, 1.0)] * 3)
+
+
+@pytest.mark.skipif(core._ext is None, reason="extensión Cython no compilada")
+def test_cython_pack_channel_checks_bounds():
+    out = np.empty((20, 30, 3), dtype=np.uint8)
+
+    with pytest.raises(ValueError):
+        core._ext.pack_channel(np.zeros((40, 30), np.float32), 0.0, 1.0, out, 0)
+    with pytest.raises(ValueError):
+        core._ext.pack_channel(np.zeros((20, 30), np.float32), 0.0, 1.0, out, 3)